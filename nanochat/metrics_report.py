@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+import base64
 import dataclasses
 import datetime as dt
+import gzip
 import json
-import math
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 _GPU_CSV_RE = re.compile(r"^gpu_(?P<phase>.+)_(?P<ts>\d{8}_\d{6})\.csv$")
-
-# Upper bound on rendered points per (file, metric, GPU) time-series in the HTML.
-# This keeps the JSON payload and Plotly rendering snappy even for long runs.
-MAX_POINTS_PER_SERIES = 1000
+# "GPU 0: NVIDIA RTX A5000 (UUID: ...)" lines emitted by `nvidia-smi -L`
+_GPU_META_RE = re.compile(r"GPU\s+(?P<idx>\d+):\s+(?P<name>.+?)\s+\(UUID:\s+(?P<uuid>.+)\)")
+_FLOAT_RE = re.compile(r"[-+]?\d+(\.\d+)?")
+
+# Upper bound on rendered points per (file, GPU) time-series in the HTML. The
+# timestamp axis is shared across all metrics of a GPU, so the bound applies to
+# the capped union of the per-metric LTTB picks. This keeps the payload bounded
+# for long runs; scattergl (WebGL) rendering stays smooth at this trace size.
+MAX_POINTS_PER_SERIES = 8000
+
+# Numeric metric columns produced by the CSV parse. All are low-precision
+# physical quantities (percent, W, MHz, C, MiB), so float32 is lossless for
+# rendering purposes and halves memory + payload bytes vs float64.
+_METRIC_COLUMNS = (
+    "gpu_util_pct",
+    "mem_util_pct",
+    "power_w",
+    "sm_clock_mhz",
+    "mem_clock_mhz",
+    "temp_c",
+    "mem_used_mib",
+    "mem_total_mib",
+)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -55,6 +76,7 @@ def discover_metrics_files(metrics_dir: Optional[Path] = None) -> List[MetricsFi
 
 
 def _to_float_unit(value: Any, unit_suffix: str) -> Optional[float]:
+    # Scalar fallback; the hot path uses the vectorized _strip_unit_series below.
     if value is None:
         return None
     s = str(value).strip()
@@ -68,10 +90,25 @@ def _to_float_unit(value: Any, unit_suffix: str) -> Optional[float]:
         return float(s)
     except ValueError:
         # last resort: pull the first float-like token
-        m = re.search(r"[-+]?\d+(\.\d+)?", s)
+        m = _FLOAT_RE.search(s)
         return float(m.group(0)) if m else None
 
 
+def _strip_unit_series(series, unit_suffix: str):
+    """
+    Vectorized equivalent of _to_float_unit for a whole column: strip the unit
+    suffix with pandas' C string kernels and coerce to float, without invoking
+    a Python callback per cell.
+    """
+    import pandas as pd
+
+    s = series.astype("string").str.strip()
+    if unit_suffix:
+        s = s.str.removesuffix(unit_suffix).str.strip()
+    s = s.replace({"N/A": pd.NA, "n/a": pd.NA})
+    return pd.to_numeric(s, errors="coerce")
+
+
 def _normalize_columns(cols: Iterable[str]) -> List[str]:
     # Strip spaces; keep original names but normalized
     out = []
@@ -80,60 +117,162 @@ def _normalize_columns(cols: Iterable[str]) -> List[str]:
     return out
 
 
-def load_metrics_dataframe(csv_path: Path):
+def _strip_unit_array(arr, unit_suffix: str):
     """
-    Load a single nvidia-smi CSV (as written by our scripts) into a DataFrame with:
-      - ts: datetime
-      - gpu_index: int
-      - gpu_util_pct, mem_util_pct: float
-      - power_w: float
-      - sm_clock_mhz, mem_clock_mhz: float
-      - temp_c: float
-      - mem_used_mib, mem_total_mib: float
+    Arrow-side unit stripping: trim whitespace, drop the trailing unit token and
+    cast to float64, all via Arrow compute kernels (no Python str/float objects).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    s = pc.utf8_trim_whitespace(arr.cast(pa.string()))
+    if unit_suffix:
+        s = pc.replace_substring_regex(s, pattern=re.escape(unit_suffix) + r"\s*$", replacement="")
+        s = pc.utf8_trim_whitespace(s)
+    s = pc.if_else(pc.equal(s, ""), pa.scalar(None, pa.string()), s)
+    try:
+        return pc.cast(s, pa.float64())
+    except pa.ArrowInvalid:
+        # Malformed cells: fall back to pandas' coercing parser for this column.
+        return pa.Array.from_pandas(_strip_unit_series(s.to_pandas(), ""))
+
+
+def _csv_stamp(csv_path: Path) -> Dict[str, int]:
+    st = csv_path.stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def load_metrics_table(csv_path: Path):
+    """
+    Load a single nvidia-smi CSV as a typed pyarrow Table (see
+    _read_metrics_table for the schema). The Table is persisted as Arrow IPC
+    in a sidecar <csv>.cache.arrow, invalidated by the CSV's (mtime, size)
+    recorded in <csv>.cache.meta.json; warm reruns memory-map the IPC file
+    instead of re-parsing the CSV. Caching is best-effort: a read-only
+    metrics dir or a corrupt sidecar silently falls back to a fresh parse.
+    """
+    import pyarrow as pa
+
+    cache_path = csv_path.with_suffix(".cache.arrow")
+    cache_meta_path = csv_path.with_suffix(".cache.meta.json")
+    stamp = _csv_stamp(csv_path)
+
+    if cache_path.exists() and cache_meta_path.exists():
+        try:
+            if json.loads(cache_meta_path.read_text(encoding="utf-8")) == stamp:
+                source = pa.memory_map(str(cache_path), "r")
+                return pa.ipc.RecordBatchFileReader(source).read_all()
+        except (OSError, ValueError, pa.ArrowInvalid):
+            pass  # stale/corrupt cache: re-parse below
+
+    table = _read_metrics_table(csv_path)
+    try:
+        with pa.OSFile(str(cache_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        cache_meta_path.write_text(json.dumps(stamp), encoding="utf-8")
+    except OSError:
+        pass
+    return table
+
+
+def _read_metrics_table(csv_path: Path):
+    """
+    Parse a single nvidia-smi CSV into a typed pyarrow Table with columns:
+      - ts: timestamp[ns]
+      - gpu_index: int64 (nullable)
+      - gpu_util_pct, mem_util_pct, power_w, sm_clock_mhz, mem_clock_mhz,
+        temp_c, mem_used_mib, mem_total_mib: float64
+
+    Uses Arrow's multithreaded CSV tokenizer and compute kernels so values stay
+    columnar end to end; Python objects are only created at the pandas boundary.
     """
     import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
 
-    df = pd.read_csv(csv_path, skipinitialspace=True)
-    df.columns = _normalize_columns(df.columns)
+    read_opts = pacsv.ReadOptions(use_threads=True)
+    parse_opts = pacsv.ParseOptions(delimiter=",", ignore_empty_lines=True)
+    convert_opts = pacsv.ConvertOptions(strings_can_be_null=True, null_values=["N/A", "n/a", ""])
+    raw = pacsv.read_csv(csv_path, read_options=read_opts, parse_options=parse_opts, convert_options=convert_opts)
+    raw = raw.rename_columns(_normalize_columns(raw.column_names))
 
     # Find columns robustly (nvidia-smi adds units to headers)
     def find_col(prefix: str) -> str:
-        for c in df.columns:
+        for c in raw.column_names:
             if c.startswith(prefix):
                 return c
         raise KeyError(f"Missing expected column starting with {prefix!r} in {csv_path}")
 
-    col_ts = find_col("timestamp")
-    col_index = find_col("index")
-    col_gpu_util = find_col("utilization.gpu")
-    col_mem_util = find_col("utilization.memory")
-    col_power = find_col("power.draw")
-    col_sm_clock = find_col("clocks.current.sm")
-    col_mem_clock = find_col("clocks.current.memory")
-    col_temp = find_col("temperature.gpu")
-    col_mem_used = find_col("memory.used")
-    col_mem_total = find_col("memory.total")
-
-    # Parse timestamp (format observed: YYYY/MM/DD HH:MM:SS.mmm)
-    df["ts"] = pd.to_datetime(df[col_ts], errors="coerce")
-    df["gpu_index"] = pd.to_numeric(df[col_index], errors="coerce").astype("Int64")
-
-    df["gpu_util_pct"] = df[col_gpu_util].map(lambda v: _to_float_unit(v, "%"))
-    df["mem_util_pct"] = df[col_mem_util].map(lambda v: _to_float_unit(v, "%"))
-    df["power_w"] = df[col_power].map(lambda v: _to_float_unit(v, "W"))
-    df["sm_clock_mhz"] = df[col_sm_clock].map(lambda v: _to_float_unit(v, "MHz"))
-    df["mem_clock_mhz"] = df[col_mem_clock].map(lambda v: _to_float_unit(v, "MHz"))
-    df["temp_c"] = df[col_temp].map(lambda v: _to_float_unit(v, ""))  # unitless integer
-    df["mem_used_mib"] = df[col_mem_used].map(lambda v: _to_float_unit(v, "MiB"))
-    df["mem_total_mib"] = df[col_mem_total].map(lambda v: _to_float_unit(v, "MiB"))
-
-    # Drop rows where timestamp or index couldn't parse
+    # Parse timestamp (format observed: YYYY/MM/DD HH:MM:SS.mmm); pandas handles
+    # the fractional seconds that Arrow's strptime does not.
+    ts = pa.Array.from_pandas(pd.to_datetime(raw[find_col("timestamp")].to_pandas(), errors="coerce"))
+    gpu_index = pc.cast(_strip_unit_array(raw[find_col("index")], ""), pa.int64())
+
+    return pa.table(
+        {
+            "ts": ts,
+            "gpu_index": gpu_index,
+            "gpu_util_pct": _strip_unit_array(raw[find_col("utilization.gpu")], "%"),
+            "mem_util_pct": _strip_unit_array(raw[find_col("utilization.memory")], "%"),
+            "power_w": _strip_unit_array(raw[find_col("power.draw")], "W"),
+            "sm_clock_mhz": _strip_unit_array(raw[find_col("clocks.current.sm")], "MHz"),
+            "mem_clock_mhz": _strip_unit_array(raw[find_col("clocks.current.memory")], "MHz"),
+            "temp_c": _strip_unit_array(raw[find_col("temperature.gpu")], ""),  # unitless integer
+            "mem_used_mib": _strip_unit_array(raw[find_col("memory.used")], "MiB"),
+            "mem_total_mib": _strip_unit_array(raw[find_col("memory.total")], "MiB"),
+        }
+    )
+
+
+def table_to_dataframe(table):
+    """
+    Convert a metrics Table (from load_metrics_table) into the plotting
+    DataFrame: rows with unparseable timestamp/index dropped, gpu_index as
+    plain int, metric columns as float32.
+    """
+    df = table.to_pandas()
     df = df.dropna(subset=["ts", "gpu_index"])
     df["gpu_index"] = df["gpu_index"].astype(int)
-
+    for c in _METRIC_COLUMNS:
+        df[c] = df[c].astype("float32")
     return df
 
 
+def _summarize_table(table) -> Dict[str, Any]:
+    """
+    Per-file summary (time span, GPU count, valid row count) computed with
+    Arrow kernels directly on the Table — no pandas conversion needed.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    ts_min = pc.min(table["ts"]).as_py()
+    ts_max = pc.max(table["ts"]).as_py()
+    valid = pc.and_(pc.is_valid(table["ts"]), pc.is_valid(table["gpu_index"]))
+    return {
+        "time_start": ts_min.isoformat() if ts_min is not None else None,
+        "time_end": ts_max.isoformat() if ts_max is not None else None,
+        "gpu_count": pc.count_distinct(table["gpu_index"], mode="only_valid").as_py(),
+        "rows": pc.sum(pc.cast(valid, pa.int64())).as_py() or 0,
+    }
+
+
+def load_metrics_dataframe(csv_path: Path):
+    """
+    Load a single nvidia-smi CSV (as written by our scripts) into a DataFrame with:
+      - ts: datetime
+      - gpu_index: int
+      - gpu_util_pct, mem_util_pct: float
+      - power_w: float
+      - sm_clock_mhz, mem_clock_mhz: float
+      - temp_c: float
+      - mem_used_mib, mem_total_mib: float
+    """
+    return table_to_dataframe(load_metrics_table(csv_path))
+
+
 def parse_meta_file(meta_path: Path) -> Dict[str, Any]:
     """
     Best-effort parse of our .meta.txt file format.
@@ -141,20 +280,28 @@ def parse_meta_file(meta_path: Path) -> Dict[str, Any]:
     """
     if not meta_path.exists():
         return {}
-    text = meta_path.read_text(encoding="utf-8", errors="replace")
+    # Memoized: the index build and the report build both parse every meta file
+    # in one CLI run; keying on mtime keeps the cache honest across edits.
+    return _parse_meta_cached(str(meta_path), meta_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _parse_meta_cached(meta_path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    meta_path = Path(meta_path_str)
     out: Dict[str, Any] = {}
-    for line in text.splitlines():
-        if "=" in line and not line.startswith("["):
-            k, v = line.split("=", 1)
-            out[k.strip()] = v.strip()
-    # Parse GPU list
     gpus: List[Dict[str, str]] = []
-    for line in text.splitlines():
-        if line.startswith("GPU ") and ":" in line and "(UUID:" in line:
-            # GPU 0: NVIDIA RTX A5000 (UUID: ...)
-            m = re.match(r"GPU\s+(?P<idx>\d+):\s+(?P<name>.+?)\s+\(UUID:\s+(?P<uuid>.+)\)", line)
-            if m:
-                gpus.append({"index": m.group("idx"), "name": m.group("name"), "uuid": m.group("uuid")})
+    # Single streamed pass: both the k=v lines and the `nvidia-smi -L` GPU
+    # list, without materializing the whole file or a splitlines() list.
+    with meta_path.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line.startswith("GPU ") and "(UUID:" in line:
+                m = _GPU_META_RE.match(line)
+                if m:
+                    gpus.append({"index": m.group("idx"), "name": m.group("name"), "uuid": m.group("uuid")})
+            elif "=" in line and not line.startswith("["):
+                k, v = line.split("=", 1)
+                out[k.strip()] = v.strip()
     if gpus:
         out["gpus"] = gpus
     return out
@@ -171,6 +318,8 @@ def build_metrics_index(metrics_dir: Optional[Path] = None) -> Dict[str, Any]:
     index: Dict[str, Any] = {"metrics_dir": str(metrics_dir), "files": []}
     for f in files:
         meta = parse_meta_file(f.meta_path)
+        # Arrow-only summary: no pandas conversion when just indexing
+        summary = _summarize_table(load_metrics_table(f.csv_path))
         index["files"].append(
             {
                 "key": f.key,
@@ -178,134 +327,274 @@ def build_metrics_index(metrics_dir: Optional[Path] = None) -> Dict[str, Any]:
                 "timestamp": f.timestamp.strftime("%Y%m%d_%H%M%S"),
                 "csv_path": str(f.csv_path),
                 "meta": meta,
+                "summary": summary,
             }
         )
     return index
 
 
-def generate_html_report(metrics_dir: Optional[Path] = None, out_path: Optional[Path] = None) -> Path:
+def _lttb_indices(x, y, n_out: int):
     """
-    Build a self-contained HTML report with selectors (phase/run via file key)
-    and interactive Plotly charts.
+    Largest-Triangle-Three-Buckets downsampling: pick n_out row indices that
+    preserve the visual envelope (peaks/valleys) of the series, unlike naive
+    striding which aliases spikes away. x/y are 1-D numpy arrays; returns the
+    selected indices in ascending order. NaNs in y are forward-filled for the
+    area math only; callers keep the original values.
     """
-    import pandas as pd
-    import plotly.graph_objects as go
-    import plotly.io as pio
+    import numpy as np
+
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Forward-fill NaNs so triangle areas are defined; lead NaNs become 0.
+    mask = np.isnan(y)
+    if mask.all():
+        return np.linspace(0, n - 1, n_out).astype(np.intp)
+    if mask.any():
+        fill_idx = np.where(~mask, np.arange(n), 0)
+        np.maximum.accumulate(fill_idx, out=fill_idx)
+        y = y[fill_idx]
+        y[np.isnan(y)] = 0.0
+
+    # Bucket boundaries over the interior points; first/last rows always kept.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    out = np.empty(n_out, dtype=np.intp)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0  # index of the previously selected point
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Mean of the next bucket (the final bucket pairs with the last point)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], edges[i + 2]
+        else:
+            nlo, nhi = n - 1, n
+        mean_x = x[nlo:nhi].mean()
+        mean_y = y[nlo:nhi].mean()
+        # Triangle area between the fixed point a, each candidate, and the mean
+        area = np.abs(
+            (x[a] - mean_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
 
-    metrics_dir = metrics_dir or _default_metrics_dir()
-    out_path = out_path or (metrics_dir / "report.html")
 
-    files = discover_metrics_files(metrics_dir)
-    if not files:
-        raise FileNotFoundError(f"No gpu_*.csv files found under {metrics_dir}")
+# Layout shared by every figure; shipped once as payload["layout_template"]
+# instead of being duplicated across 6 metrics x N files. Per-figure title and
+# y-axis unit are merged in by the browser at render time.
+_BASE_LAYOUT = {
+    # Explicit date axis: typed-array x values are raw epoch-ms numbers
+    # and would not trigger plotly's date inference.
+    "xaxis": {"title": {"text": "Time"}, "type": "date"},
+    "legend": {"title": {"text": "GPU"}},
+    "margin": {"l": 40, "r": 20, "t": 60, "b": 40},
+    "height": 520,
+}
+
+# Metric columns rendered in the report: (dataframe column, title, y-axis unit)
+_METRIC_SPECS: List[Tuple[str, str, str]] = [
+    ("gpu_util_pct", "GPU Utilization (%)", "Percent"),
+    ("mem_used_mib", "GPU Memory Used (MiB)", "MiB"),
+    ("power_w", "Power Draw (W)", "W"),
+    ("temp_c", "Temperature (C)", "C"),
+    ("sm_clock_mhz", "SM Clock (MHz)", "MHz"),
+    ("mem_clock_mhz", "Memory Clock (MHz)", "MHz"),
+]
+
+
+def _array_ref(arr) -> Dict[str, Any]:
+    """
+    Capture a numpy array as {"dtype", "data"} raw little-endian bytes. The
+    report packer concatenates all of these into one gzip blob and rewrites
+    each ref to {"dtype", "start", "n"} offsets into it; the browser inflates
+    the blob once and takes zero-copy TypedArray views.
+    """
+    import numpy as np
 
-    # Build figure JSON per (file, metric)
-    metric_specs = [
-        ("gpu_util_pct", "GPU Utilization (%)", "Percent"),
-        ("mem_used_mib", "GPU Memory Used (MiB)", "MiB"),
-        ("power_w", "Power Draw (W)", "W"),
-        ("temp_c", "Temperature (C)", "C"),
-        ("sm_clock_mhz", "SM Clock (MHz)", "MHz"),
-        ("mem_clock_mhz", "Memory Clock (MHz)", "MHz"),
-    ]
-
-    figures: Dict[str, Dict[str, Any]] = {}
-    summaries: Dict[str, Any] = {}
-    meta_by_key: Dict[str, Any] = {}
+    arr = np.ascontiguousarray(arr)
+    return {"dtype": str(arr.dtype), "data": arr.tobytes()}
 
-    for mf in files:
-        df = load_metrics_dataframe(mf.csv_path)
-        meta_by_key[mf.key] = parse_meta_file(mf.meta_path)
-
-        # Summary per file (across all GPUs)
-        summaries[mf.key] = {
-            "time_start": df["ts"].min().isoformat() if len(df) else None,
-            "time_end": df["ts"].max().isoformat() if len(df) else None,
-            "gpu_count": int(df["gpu_index"].nunique()) if len(df) else 0,
-            "rows": int(len(df)),
-        }
 
-        for metric, title, yunit in metric_specs:
-            fig = go.Figure()
-            for gpu_idx in sorted(df["gpu_index"].unique()):
-                sdf = df[df["gpu_index"] == gpu_idx]
-                # Downsample long, mostly smooth series to keep the HTML light.
-                n = len(sdf)
-                if n > MAX_POINTS_PER_SERIES:
-                    step = max(1, math.ceil(n / MAX_POINTS_PER_SERIES))
-                    sdf = sdf.iloc[::step]
-                fig.add_trace(
-                    go.Scatter(
-                        x=sdf["ts"],
-                        y=sdf[metric],
-                        mode="lines",
-                        name=f"GPU {gpu_idx}",
-                    )
-                )
-            fig.update_layout(
-                title=title,
-                xaxis_title="Time",
-                yaxis_title=yunit,
-                legend_title="GPU",
-                margin=dict(l=40, r=20, t=60, b=40),
-                height=520,
-            )
-            # Serialize via Plotly's JSON engine to avoid np.ndarray objects
-            fig_key = f"{mf.key}__{metric}"
-            figures[fig_key] = pio.to_json(fig, validate=False, engine="json")
+_BLOB_ITEMSIZE = {"float32": 4, "float64": 8}
 
-    # Simple run grouping: by date (YYYYmmdd) inferred from filename timestamp
-    runs: Dict[str, List[str]] = {}
-    for mf in files:
-        run_id = mf.timestamp.strftime("%Y%m%d")
-        runs.setdefault(run_id, []).append(mf.key)
-    # Ensure stable ordering
-    runs = {k: sorted(v) for k, v in sorted(runs.items())}
 
-    payload = {
-        "metrics_dir": str(metrics_dir),
-        "runs": runs,
-        "files": [
-            {
-                "key": mf.key,
-                "phase": mf.phase,
-                "timestamp": mf.timestamp.strftime("%Y%m%d_%H%M%S"),
-            }
-            for mf in files
-        ],
-        "metric_specs": [{"key": m, "title": t, "unit": u} for (m, t, u) in metric_specs],
-        "summaries": summaries,
-        "meta_by_key": meta_by_key,
-        "figures": figures,
-        "generated_at": dt.datetime.now().isoformat(),
+def _pack_series_blob(series_by_file: Dict[str, Dict[str, Any]]) -> bytes:
+    """
+    Concatenate every array ref in series_by_file into a single binary blob,
+    rewriting each {"dtype", "data"} ref in place to {"dtype", "start", "n"}.
+    Arrays are 8-byte aligned so the browser can view them without copying.
+    """
+    blob = bytearray()
+
+    def pack(ref: Dict[str, Any]) -> Dict[str, Any]:
+        itemsize = _BLOB_ITEMSIZE[ref["dtype"]]
+        blob.extend(b"\0" * (-len(blob) % 8))
+        data = ref.pop("data")
+        ref["start"] = len(blob)
+        ref["n"] = len(data) // itemsize
+        blob.extend(data)
+        return ref
+
+    for series in series_by_file.values():
+        for g in series["gpus"].values():
+            g["ts"] = pack(g["ts"])
+            g["metrics"] = {m: pack(v) for m, v in g["metrics"].items()}
+    return bytes(blob)
+
+
+# Bump when the series layout or downsampling output changes, so stale
+# sidecars from older code are rebuilt even though the CSV stamp matches.
+_SERIES_CACHE_VERSION = 2
+
+
+def _load_series_cache(cache_path: Path, stamp: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    """
+    Load a <csv>.series.json.gz sidecar (summary + packed-ready series) if its
+    stamp still matches the CSV; returns None on any mismatch or error. Array
+    bytes are stored base64 inside the JSON and decoded back to raw bytes here
+    so the report packer can concatenate them untouched.
+    """
+    if not cache_path.exists():
+        return None
+    try:
+        obj = json.loads(gzip.decompress(cache_path.read_bytes()))
+        if obj.get("version") != _SERIES_CACHE_VERSION or obj.get("stamp") != stamp:
+            return None
+        # Inside the try: a sidecar written by an older code version can have a
+        # matching stamp but a different structure.
+        for g in obj["gpus"].values():
+            g["ts"]["data"] = base64.b64decode(g["ts"].pop("b64"))
+            for ref in g["metrics"].values():
+                ref["data"] = base64.b64decode(ref.pop("b64"))
+    except (OSError, EOFError, ValueError, KeyError, TypeError, AttributeError):
+        return None  # truncated gzip, malformed JSON or unexpected structure
+    return obj
+
+
+def _save_series_cache(cache_path: Path, stamp: Dict[str, int], summary: Dict[str, Any], gpus: Dict[str, Any]) -> None:
+    """Best-effort write of the series sidecar; see _load_series_cache."""
+    enc_gpus = {
+        gpu_idx: {
+            "ts": {"dtype": g["ts"]["dtype"], "b64": base64.b64encode(g["ts"]["data"]).decode("ascii")},
+            "metrics": {
+                m: {"dtype": ref["dtype"], "b64": base64.b64encode(ref["data"]).decode("ascii")}
+                for m, ref in g["metrics"].items()
+            },
+        }
+        for gpu_idx, g in gpus.items()
     }
+    payload = gzip.compress(
+        json.dumps(
+            {"version": _SERIES_CACHE_VERSION, "stamp": stamp, "summary": summary, "gpus": enc_gpus}
+        ).encode("utf-8"),
+        6,
+    )
+    # Atomic write: an interrupted run must not leave a truncated sidecar behind
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
-    html = f"""<!doctype html>
+
+def _process_file(mf: MetricsFile) -> Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Parse one metrics file and build its summary, meta and raw per-GPU series.
+    The browser constructs the Plotly figure for the selected (file, metric) on
+    demand, so only the data arrays ship in the payload — no per-figure
+    structures. Runs in a worker process, so heavy imports stay inside the
+    function and the return value is plain picklable data.
+    """
+    import numpy as np
+
+    # Materialized-view cache: if the CSV is unchanged, reuse the finished
+    # summary + series and skip parsing/downsampling entirely. Meta stays
+    # outside the cache (cheap, memoized, and can change independently).
+    series_cache_path = mf.csv_path.with_suffix(".series.json.gz")
+    stamp = _csv_stamp(mf.csv_path)
+    cached = _load_series_cache(series_cache_path, stamp)
+    if cached is not None:
+        return mf.key, cached["summary"], parse_meta_file(mf.meta_path), {"gpus": cached["gpus"]}
+
+    table = load_metrics_table(mf.csv_path)
+    summary = _summarize_table(table)  # across all GPUs
+    df = table_to_dataframe(table)
+    meta = parse_meta_file(mf.meta_path)
+
+    # Struct-of-arrays per GPU: one shared timestamp array plus one column per
+    # metric, instead of duplicating the x axis under every metric. JSON keys
+    # are strings, so GPU indices are stringified here.
+    gpus: Dict[str, Any] = {}
+    # One C-level groupby pass instead of a boolean-mask scan per GPU
+    for gpu_idx, gdf in df.groupby("gpu_index", sort=True):
+        # Metrics that are entirely N/A for this GPU (e.g. power.draw on
+        # consumer cards) are dropped; the browser shows a "no data" fallback.
+        present = [m for m, _title, _yunit in _METRIC_SPECS if gdf[m].notna().any()]
+        # Downsample long series to keep the HTML light; LTTB keeps the
+        # peaks/valleys that stride decimation would alias away. The selected
+        # rows start as the union of each metric's picks so the timestamp
+        # array can be shared across all six metrics; on noisy signals the
+        # union can blow past the cap, so a final LTTB pass over the union
+        # rows (driven by the first present metric, i.e. GPU util when
+        # available) enforces MAX_POINTS_PER_SERIES as a hard bound.
+        if len(gdf) > MAX_POINTS_PER_SERIES:
+            x_ns = gdf["ts"].astype("int64").to_numpy()
+            sel = np.zeros(len(gdf), dtype=bool)
+            for metric in present:
+                y = gdf[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+                sel[_lttb_indices(x_ns, y, MAX_POINTS_PER_SERIES)] = True
+            sel_idx = np.flatnonzero(sel)
+            if len(sel_idx) > MAX_POINTS_PER_SERIES:
+                y = gdf[present[0]].to_numpy(dtype=np.float64, na_value=np.nan)
+                final = _lttb_indices(x_ns[sel_idx], y[sel_idx], MAX_POINTS_PER_SERIES)
+                sel_idx = sel_idx[final]
+            gdf = gdf.iloc[sel_idx]
+        gpus[str(gpu_idx)] = {
+            # float64 milliseconds since epoch (plotly date axis)
+            "ts": _array_ref(gdf["ts"].astype("int64").to_numpy() / 1e6),
+            "metrics": {
+                metric: _array_ref(gdf[metric].to_numpy(dtype=np.float32, na_value=np.nan))
+                for metric in present
+            },
+        }
+
+    _save_series_cache(series_cache_path, stamp, summary, gpus)
+    return mf.key, summary, meta, {"gpus": gpus}
+
+
+# Static HTML shell, written around the streamed JSON payload. __GENERATED_AT__
+# and __METRICS_DIR__ are substituted at write time.
+_HTML_HEAD = """<!doctype html>
 <html>
 <head>
   <meta charset="utf-8"/>
   <meta name="viewport" content="width=device-width, initial-scale=1"/>
   <title>nanochat GPU Metrics Report</title>
   <style>
-    body {{ font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 0; }}
-    header {{ padding: 14px 18px; border-bottom: 1px solid #e5e7eb; }}
-    .container {{ display: grid; grid-template-columns: 360px 1fr; min-height: calc(100vh - 54px); }}
-    .sidebar {{ border-right: 1px solid #e5e7eb; padding: 14px 18px; }}
-    .content {{ padding: 14px 18px; }}
-    label {{ display:block; font-size: 12px; margin-top: 12px; color:#374151; }}
-    select {{ width: 100%; padding: 8px; margin-top: 6px; }}
-    .kpi {{ display:grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 10px; margin-top: 12px; }}
-    .card {{ border: 1px solid #e5e7eb; border-radius: 10px; padding: 10px; }}
-    .card .k {{ font-size: 12px; color:#6b7280; }}
-    .card .v {{ font-size: 14px; font-weight: 600; margin-top: 2px; }}
-    .meta {{ margin-top: 14px; font-size: 12px; color:#374151; white-space: pre-wrap; }}
+    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 0; }
+    header { padding: 14px 18px; border-bottom: 1px solid #e5e7eb; }
+    .container { display: grid; grid-template-columns: 360px 1fr; min-height: calc(100vh - 54px); }
+    .sidebar { border-right: 1px solid #e5e7eb; padding: 14px 18px; }
+    .content { padding: 14px 18px; }
+    label { display:block; font-size: 12px; margin-top: 12px; color:#374151; }
+    select { width: 100%; padding: 8px; margin-top: 6px; }
+    .kpi { display:grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 10px; margin-top: 12px; }
+    .card { border: 1px solid #e5e7eb; border-radius: 10px; padding: 10px; }
+    .card .k { font-size: 12px; color:#6b7280; }
+    .card .v { font-size: 14px; font-weight: 600; margin-top: 2px; }
+    .meta { margin-top: 14px; font-size: 12px; color:#374151; white-space: pre-wrap; }
   </style>
   <script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
 </head>
 <body>
   <header>
     <div style="font-weight:700">nanochat GPU Metrics Report</div>
-    <div style="font-size:12px;color:#6b7280">Generated at: {payload["generated_at"]} | Source: {payload["metrics_dir"]}</div>
+    <div style="font-size:12px;color:#6b7280">Generated at: __GENERATED_AT__ | Source: __METRICS_DIR__</div>
   </header>
   <div class="container">
     <div class="sidebar">
@@ -325,96 +614,246 @@ def generate_html_report(metrics_dir: Optional[Path] = None, out_path: Optional[
   </div>
 
   <script>
-  const DATA = {json.dumps(payload)};
+  const DATA_INLINE = """
+
+_HTML_TAIL = """;
+  const DATA_URL = "__DATA_URL__";
+  let DATA = DATA_INLINE;
+
+  // When the payload is not embedded, fetch + inflate the sibling .json.gz
+  // (requires serving over HTTP; file:// cannot fetch).
+  async function loadData() {
+    if (DATA) return;
+    const blob = await (await fetch(DATA_URL)).blob();
+    const stream = blob.stream().pipeThrough(new DecompressionStream('gzip'));
+    DATA = await new Response(stream).json();
+  }
 
-  function el(id) {{ return document.getElementById(id); }}
+  function el(id) { return document.getElementById(id); }
 
-  function fillSelect(selectEl, options, selectedValue) {{
+  function fillSelect(selectEl, options, selectedValue) {
     selectEl.innerHTML = '';
-    for (const opt of options) {{
+    for (const opt of options) {
       const o = document.createElement('option');
       o.value = opt.value;
       o.textContent = opt.label;
       if (selectedValue && opt.value === selectedValue) o.selected = true;
       selectEl.appendChild(o);
-    }}
-  }}
+    }
+  }
 
-  function updateFilesForRun(runId) {{
+  function updateFilesForRun(runId) {
     const keys = DATA.runs[runId] || [];
-    const options = keys.map(k => {{
+    const options = keys.map(k => {
       const f = DATA.files.find(x => x.key === k);
-      const label = f ? `${{f.timestamp}} — ${{f.phase}}` : k;
-      return {{ value: k, label }};
-    }});
+      const label = f ? `${f.timestamp} — ${f.phase}` : k;
+      return { value: k, label };
+    });
     fillSelect(el('fileSel'), options, options[0]?.value);
-  }}
+  }
 
-  function updateKpiAndMeta(fileKey) {{
-    const s = DATA.summaries[fileKey] || {{}};
+  function updateKpiAndMeta(fileKey) {
+    const s = DATA.summaries[fileKey] || {};
     const cards = [
-      {{k:'Start', v: s.time_start || '-'}},
-      {{k:'End', v: s.time_end || '-'}},
-      {{k:'GPUs', v: (s.gpu_count ?? '-')}},
-      {{k:'Rows', v: (s.rows ?? '-')}},
+      {k:'Start', v: s.time_start || '-'},
+      {k:'End', v: s.time_end || '-'},
+      {k:'GPUs', v: (s.gpu_count ?? '-')},
+      {k:'Rows', v: (s.rows ?? '-')},
     ];
     el('kpi').innerHTML = '';
-    for (const c of cards) {{
+    for (const c of cards) {
       const div = document.createElement('div');
       div.className = 'card';
-      div.innerHTML = `<div class="k">${{c.k}}</div><div class="v">${{c.v}}</div>`;
+      div.innerHTML = `<div class="k">${c.k}</div><div class="v">${c.v}</div>`;
       el('kpi').appendChild(div);
-    }}
+    }
 
-    const meta = DATA.meta_by_key[fileKey] || {{}};
+    const meta = DATA.meta_by_key[fileKey] || {};
     el('meta').textContent = Object.keys(meta).length ? JSON.stringify(meta, null, 2) : '';
-  }}
-
-  function renderPlot(fileKey, metricKey) {{
-    const figKey = `${{fileKey}}__${{metricKey}}`;
-    const raw = DATA.figures[figKey];
-    const fig = raw ? JSON.parse(raw) : null;
-    if (!fig) {{
+  }
+
+  // All numeric arrays live in one gzip blob, inflated once at startup.
+  // Refs {dtype, start, n} become zero-copy TypedArray views into it;
+  // already-decoded arrays pass through untouched.
+  let BLOB = null;
+  function decodeArray(v) {
+    if (!v || typeof v !== 'object' || v.start === undefined) return v;
+    const ctors = {float32: Float32Array, float64: Float64Array};
+    return new (ctors[v.dtype] || Float64Array)(BLOB, v.start, v.n);
+  }
+
+  // Build the Plotly figure for the selected (file, metric) on demand from the
+  // raw per-GPU series; only the data arrays ship in the payload.
+  function renderPlot(fileKey, metricKey) {
+    const file = DATA.series_by_file[fileKey];
+    const spec = DATA.metric_specs.find(m => m.key === metricKey);
+    const traces = [];
+    if (file) {
+      for (const gpuIdx of Object.keys(file.gpus).sort((a, b) => a - b)) {
+        const g = file.gpus[gpuIdx];
+        const y = g.metrics[metricKey];
+        if (!y) continue;
+        g.ts = decodeArray(g.ts);  // shared x axis, decoded once per GPU
+        traces.push({
+          type: 'scattergl',  // WebGL: one GL context for all traces, no SVG DOM cost
+          mode: 'lines',
+          name: 'GPU ' + gpuIdx,
+          x: g.ts,
+          y: decodeArray(y),
+        });
+      }
+    }
+    if (!traces.length) {
       Plotly.purge('plot');
-      el('plot').innerHTML = '<div style=\"color:#ef4444\">Missing figure: ' + figKey + '</div>';
+      el('plot').innerHTML = '<div style=\"color:#6b7280\">No data for ' + fileKey + ' / ' + metricKey + '</div>';
       return;
-    }}
-    Plotly.react('plot', fig.data, fig.layout, {{responsive: true}});
-  }}
-
-  // init selectors
-  const runOptions = Object.keys(DATA.runs).map(r => ({{value:r, label:r}}));
-  fillSelect(el('runSel'), runOptions, runOptions[runOptions.length - 1]?.value);
-
-  const metricOptions = DATA.metric_specs.map(m => ({{value:m.key, label:m.title}}));
-  fillSelect(el('metricSel'), metricOptions, metricOptions[0]?.value);
-
-  // wire events
-  el('runSel').addEventListener('change', () => {{
+    }
+    const layout = Object.assign({}, DATA.layout_template, {
+      title: {text: spec ? spec.title : metricKey},
+      yaxis: {title: {text: spec ? spec.unit : ''}},
+    });
+    Plotly.react('plot', traces, layout, {responsive: true});
+  }
+
+  async function init() {
+    await loadData();
+
+    // inflate the shared data blob (native gzip via DecompressionStream)
+    const bytes = Uint8Array.from(atob(DATA.blob_b64), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    BLOB = await new Response(stream).arrayBuffer();
+
+    // init selectors
+    const runOptions = Object.keys(DATA.runs).map(r => ({value:r, label:r}));
+    fillSelect(el('runSel'), runOptions, runOptions[runOptions.length - 1]?.value);
+
+    const metricOptions = DATA.metric_specs.map(m => ({value:m.key, label:m.title}));
+    fillSelect(el('metricSel'), metricOptions, metricOptions[0]?.value);
+
+    // wire events
+    el('runSel').addEventListener('change', () => {
+      updateFilesForRun(el('runSel').value);
+      const fileKey = el('fileSel').value;
+      updateKpiAndMeta(fileKey);
+      renderPlot(fileKey, el('metricSel').value);
+    });
+    el('fileSel').addEventListener('change', () => {
+      const fileKey = el('fileSel').value;
+      updateKpiAndMeta(fileKey);
+      renderPlot(fileKey, el('metricSel').value);
+    });
+    el('metricSel').addEventListener('change', () => {
+      renderPlot(el('fileSel').value, el('metricSel').value);
+    });
+
+    // first render
     updateFilesForRun(el('runSel').value);
-    const fileKey = el('fileSel').value;
-    updateKpiAndMeta(fileKey);
-    renderPlot(fileKey, el('metricSel').value);
-  }});
-  el('fileSel').addEventListener('change', () => {{
-    const fileKey = el('fileSel').value;
-    updateKpiAndMeta(fileKey);
-    renderPlot(fileKey, el('metricSel').value);
-  }});
-  el('metricSel').addEventListener('change', () => {{
+    updateKpiAndMeta(el('fileSel').value);
     renderPlot(el('fileSel').value, el('metricSel').value);
-  }});
-
-  // first render
-  updateFilesForRun(el('runSel').value);
-  updateKpiAndMeta(el('fileSel').value);
-  renderPlot(el('fileSel').value, el('metricSel').value);
+  }
+  init().catch(err => {
+    const hint = location.protocol === 'file:'
+      ? ' (file:// pages cannot fetch the sidecar .data.json.gz — regenerate with --embed, or serve this directory over HTTP)'
+      : '';
+    el('plot').innerHTML = '<div style="color:#ef4444">Failed to load report data' + hint + ': ' + err + '</div>';
+  });
   </script>
 </body>
 </html>
 """
 
+
+def generate_html_report(
+    metrics_dir: Optional[Path] = None,
+    out_path: Optional[Path] = None,
+    embed: bool = False,
+) -> Path:
+    """
+    Build an HTML report with selectors (phase/run via file key) and
+    interactive Plotly charts. By default the data payload is written to a
+    sibling <out>.data.json.gz fetched by the page, so the HTML shell parses
+    and renders instantly regardless of run size (serve over HTTP to view).
+    With embed=True the payload is inlined for a single self-contained file.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    import orjson
+
+    metrics_dir = metrics_dir or _default_metrics_dir()
+    out_path = out_path or (metrics_dir / "report.html")
+
+    files = discover_metrics_files(metrics_dir)
+    if not files:
+        raise FileNotFoundError(f"No gpu_*.csv files found under {metrics_dir}")
+
+    metric_specs = _METRIC_SPECS
+
+    series_by_file: Dict[str, Dict[str, Any]] = {}
+    summaries: Dict[str, Any] = {}
+    meta_by_key: Dict[str, Any] = {}
+
+    # Each file is independent and the work (CSV parse + Plotly JSON) is
+    # CPU-bound and GIL-heavy, so fan out across processes, one task per file.
+    if len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as ex:
+            results = list(ex.map(_process_file, files))
+    else:
+        results = [_process_file(files[0])]
+
+    for key, summary, meta, series in results:
+        summaries[key] = summary
+        meta_by_key[key] = meta
+        series_by_file[key] = series
+
+    # Simple run grouping: by date (YYYYmmdd) inferred from filename timestamp
+    runs: Dict[str, List[str]] = {}
+    for mf in files:
+        run_id = mf.timestamp.strftime("%Y%m%d")
+        runs.setdefault(run_id, []).append(mf.key)
+    # Ensure stable ordering
+    runs = {k: sorted(v) for k, v in sorted(runs.items())}
+
+    # Pack all numeric arrays into one gzip blob; smooth GPU signals compress
+    # 2-4x and the browser inflates once, then takes zero-copy views.
+    blob = _pack_series_blob(series_by_file)
+
+    payload = {
+        "metrics_dir": str(metrics_dir),
+        "runs": runs,
+        "files": [
+            {
+                "key": mf.key,
+                "phase": mf.phase,
+                "timestamp": mf.timestamp.strftime("%Y%m%d_%H%M%S"),
+            }
+            for mf in files
+        ],
+        "metric_specs": [{"key": m, "title": t, "unit": u} for (m, t, u) in metric_specs],
+        "layout_template": _BASE_LAYOUT,
+        "summaries": summaries,
+        "meta_by_key": meta_by_key,
+        "series_by_file": series_by_file,
+        "blob_b64": base64.b64encode(gzip.compress(blob, compresslevel=6)).decode("ascii"),
+        "generated_at": dt.datetime.now().isoformat(),
+    }
+
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(html, encoding="utf-8")
+    data_path = out_path.with_suffix(".data.json.gz")
+    head = _HTML_HEAD.replace("__GENERATED_AT__", payload["generated_at"]).replace(
+        "__METRICS_DIR__", payload["metrics_dir"]
+    )
+    tail = _HTML_TAIL.replace("__DATA_URL__", data_path.name)
+    # Stream the document: static head, then orjson (one C-level pass, direct
+    # UTF-8) straight into the open file, then the static tail. No full
+    # document string is ever materialized. Without embed the shell stays tiny
+    # and the payload lands in the sibling .json.gz instead.
+    with out_path.open("wb") as f:
+        f.write(head.encode("utf-8"))
+        f.write(orjson.dumps(payload) if embed else b"null")
+        f.write(tail.encode("utf-8"))
+    if not embed:
+        with gzip.open(data_path, "wb", compresslevel=6) as gz:
+            gz.write(orjson.dumps(payload))
     return out_path
 
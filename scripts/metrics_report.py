@@ -9,12 +9,13 @@ from nanochat.metrics_report import generate_html_report
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Generate a self-contained HTML GPU metrics report from nvidia-smi CSVs.")
+    parser = argparse.ArgumentParser(description="Generate an HTML GPU metrics report from nvidia-smi CSVs: an HTML shell plus a sibling .data.json.gz payload by default, or one self-contained file with --embed.")
     parser.add_argument("--metrics-dir", type=Path, default=None, help="Directory containing gpu_*.csv files (default: $NANOCHAT_BASE_DIR/metrics).")
     parser.add_argument("--out", type=Path, default=None, help="Output HTML path (default: <metrics-dir>/report.html).")
+    parser.add_argument("--embed", action="store_true", help="Inline the data payload into the HTML (single self-contained file) instead of writing a sibling .data.json.gz.")
     args = parser.parse_args()
 
-    out = generate_html_report(metrics_dir=args.metrics_dir, out_path=args.out)
+    out = generate_html_report(metrics_dir=args.metrics_dir, out_path=args.out, embed=args.embed)
     print(f"Wrote report: {out}")
     return 0
 
@@ -0,0 +1,104 @@
+"""
+Test metrics report parsing. Example run:
+
+python -m pytest tests/test_metrics_report.py -v
+"""
+
+import textwrap
+
+import numpy as np
+import pytest
+
+from nanochat.metrics_report import _lttb_indices, load_metrics_dataframe, parse_meta_file
+
+
+CSV_HEADER = (
+    "timestamp, index, utilization.gpu [%], utilization.memory [%], power.draw [W], "
+    "clocks.current.sm [MHz], clocks.current.memory [MHz], temperature.gpu, "
+    "memory.used [MiB], memory.total [MiB]"
+)
+
+
+def write_csv(tmp_path, rows):
+    csv_path = tmp_path / "gpu_base_train_20250102_030405.csv"
+    csv_path.write_text(CSV_HEADER + "\n" + "\n".join(rows) + "\n")
+    return csv_path
+
+
+def test_load_metrics_dataframe_strips_units(tmp_path):
+    csv_path = write_csv(tmp_path, [
+        "2025/01/02 03:04:05.123, 0, 87 %, 45 %, 215.33 W, 1710 MHz, 9501 MHz, 64, 9034 MiB, 10240 MiB",
+        "2025/01/02 03:04:06.123, 1, 12 %, 3 %, 98.10 W, 1500 MHz, 9000 MHz, 41, 512 MiB, 10240 MiB",
+    ])
+    df = load_metrics_dataframe(csv_path)
+    assert len(df) == 2
+    assert df["gpu_util_pct"].tolist() == [87.0, 12.0]
+    assert df["power_w"].tolist() == pytest.approx([215.33, 98.10])
+    assert df["sm_clock_mhz"].tolist() == [1710.0, 1500.0]
+    assert df["mem_used_mib"].tolist() == [9034.0, 512.0]
+    assert df["gpu_index"].tolist() == [0, 1]
+    # Metric columns are stored as float32 (lossless at rendering precision)
+    assert all(df[c].dtype == "float32" for c in (
+        "gpu_util_pct", "power_w", "sm_clock_mhz", "mem_used_mib"))
+
+
+def test_load_metrics_dataframe_handles_na_values(tmp_path):
+    csv_path = write_csv(tmp_path, [
+        "2025/01/02 03:04:05.123, 0, 87 %, 45 %, N/A, 1710 MHz, 9501 MHz, 64, 9034 MiB, 10240 MiB",
+    ])
+    df = load_metrics_dataframe(csv_path)
+    assert len(df) == 1
+    assert df["power_w"].isna().all()
+    assert df["gpu_util_pct"].tolist() == [87.0]
+
+
+def test_parse_meta_file(tmp_path):
+    meta_path = tmp_path / "gpu_base_train_20250102_030405.meta.txt"
+    meta_path.write_text(textwrap.dedent("""\
+        phase=base_train
+        started_at=2025-01-02T03:04:05+00:00
+        interval_seconds=1
+
+        [nvidia-smi -L]
+        GPU 0: NVIDIA RTX A5000 (UUID: GPU-abc123)
+        GPU 1: NVIDIA RTX A5000 (UUID: GPU-def456)
+    """))
+    meta = parse_meta_file(meta_path)
+    assert meta["phase"] == "base_train"
+    assert meta["interval_seconds"] == "1"
+    assert meta["gpus"] == [
+        {"index": "0", "name": "NVIDIA RTX A5000", "uuid": "GPU-abc123"},
+        {"index": "1", "name": "NVIDIA RTX A5000", "uuid": "GPU-def456"},
+    ]
+
+
+def test_parse_meta_file_missing(tmp_path):
+    assert parse_meta_file(tmp_path / "nope.meta.txt") == {}
+
+
+def test_lttb_preserves_spikes():
+    n = 10_000
+    x = np.arange(n, dtype=np.float64)
+    y = np.zeros(n)
+    y[1234] = 100.0  # a narrow spike that stride decimation would skip
+    y[7777] = -50.0
+    idx = _lttb_indices(x, y, 100)
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 1234 in idx
+    assert 7777 in idx
+
+
+def test_lttb_short_series_untouched():
+    x = np.arange(10, dtype=np.float64)
+    y = np.sin(x)
+    assert np.array_equal(_lttb_indices(x, y, 1000), np.arange(10))
+
+
+def test_lttb_all_nan():
+    x = np.arange(100, dtype=np.float64)
+    y = np.full(100, np.nan)
+    idx = _lttb_indices(x, y, 10)
+    assert len(idx) == 10
+    assert idx[0] == 0 and idx[-1] == 99
@@ -211,7 +211,8 @@ run_phase "07_sft_eval" \
 python -m nanochat.report generate
 
 # Best-effort HTML GPU metrics report; do not fail the training run if it errors.
-python -m scripts.metrics_report --metrics-dir "$METRICS_DIR" --out "$METRICS_DIR/report.html" || \
+# --embed: single self-contained file, viewable from disk / easy to scp.
+python -m scripts.metrics_report --metrics-dir "$METRICS_DIR" --out "$METRICS_DIR/report.html" --embed || \
   echo "Warning: metrics HTML report generation failed."
 
 echo ""
@@ -219,7 +219,8 @@ fi
 run_phase "report_generate" python -m nanochat.report generate
 
 # Best-effort HTML GPU metrics report; do not fail the training run if it errors.
-python -m scripts.metrics_report --metrics-dir "$NANOCHAT_BASE_DIR/metrics" --out "$NANOCHAT_BASE_DIR/metrics/report.html" || \
+# --embed: single self-contained file, viewable from disk / easy to scp.
+python -m scripts.metrics_report --metrics-dir "$NANOCHAT_BASE_DIR/metrics" --out "$NANOCHAT_BASE_DIR/metrics/report.html" --embed || \
   echo "Warning: metrics HTML report generation failed."
 
 # Notes: